@@ -1,13 +1,54 @@
 import argparse
+import concurrent.futures
+import functools
 import logging
 import re
 import subprocess
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 logger = logging.getLogger(__name__)
 
+# A single pooled session shared by all GitHub API calls, so the TLS handshake is done once and reused across
+# pagination requests. Transient server errors are retried with backoff instead of failing the whole run.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)
+        ),
+        pool_connections=16,
+        pool_maxsize=16,
+    ),
+)
+
 JIRA_URL_PREFIX = "https://lingopal.atlassian.net/browse/"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+PULL_REQUEST_COMMITS_GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      commits(first: 100, after: $cursor) {
+        pageInfo {
+          endCursor
+          hasNextPage
+        }
+        nodes {
+          commit {
+            oid
+            messageHeadline
+            messageBody
+          }
+        }
+      }
+    }
+  }
+}
+"""
 CONVENTIONAL_COMMIT_BREAKING_CHANGE_INDICATORS = {"BREAKING-CHANGE", "BREAKING CHANGE"}
 
 LAST_RELEASE = "LAST_RELEASE"
@@ -17,11 +58,16 @@ STOP_POINTS = (LAST_RELEASE, PULL_REQUEST_START)
 BREAKING_CHANGE_INDICATOR = "💥 **BREAKING CHANGE:** "
 UPGRADE_INSTRUCTIONS_HEADER = "# 🔄 Upgrade instructions"
 
-COMMIT_REF_MERGE_PATTERN = re.compile(r"Merge [0-9a-f]+ into [0-9a-f]+")
 SEMANTIC_VERSION_PATTERN = re.compile(r"tag: (\d+\.\d+\.\d+)")
-CONVENTIONAL_COMMIT_PATTERN = re.compile(
-    r"^(?P<type>[a-zA-Z]+)(?:\((?P<scope>[^)]+)\))?:"
+
+# Matches conventional-commit headers (via the "type"/"scope" groups) and commit-ref merge headers (via the "merge"
+# group, anywhere in the header) in a single pass, so each commit header only enters the regex engine once.
+HEADER_PATTERN = re.compile(
+    r"^(?:(?P<type>[a-zA-Z]+)(?:\((?P<scope>[^)]+)\))?:"
+    r"|.*?(?P<merge>Merge [0-9a-f]+ into [0-9a-f]+))"
 )
+TICKET_PATTERN = re.compile(r"[a-zA-Z]{2,6}-\d+")
+SCOPE_CLEAN_PATTERN = re.compile(r"[-_]+")
 
 OTHER_SECTION_HEADING = "### 🔀 Other"
 UNCATEGORISED_SECTION_HEADING = "### ❓ Uncategorised!"
@@ -60,6 +106,30 @@ AUTO_GENERATION_END_INDICATOR = "<!--- END AUTOGENERATED NOTES --->"
 SKIP_INDICATOR = "<!--- SKIP AUTOGENERATED NOTES --->"
 
 
+def _capitalise_first_letter(note):
+    """Capitalise the first letter of a note, leaving the rest untouched. Most notes already start with a capital
+    letter, in which case the original string is returned without allocating anything.
+
+    :param str note:
+    :return str:
+    """
+    if not note or note[0].isupper():
+        return note
+
+    return note[0].upper() + note[1:]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_scope(scope):
+    """Format a scope into a title-cased subheading label, replacing hyphens and underscores with spaces. Memoized as
+    the same scopes typically recur across sections.
+
+    :param str scope:
+    :return str:
+    """
+    return SCOPE_CLEAN_PATTERN.sub(" ", scope).title()
+
+
 class PullRequestDescriptionGenerator:
     """A pull request description generator that can be used to generate release notes. The notes are pulled together
     from Conventional Commit messages, stopping at the specified stop point. The stop point can either be the last
@@ -97,6 +167,7 @@ class PullRequestDescriptionGenerator:
 
         self.current_pull_request = None
         self.previous_notes = None
+        self._tickets = []
 
         if pull_request_url:
             self.current_pull_request = self._get_current_pull_request(
@@ -111,6 +182,16 @@ class PullRequestDescriptionGenerator:
         self.commit_codes_to_headings_mapping = (
             commit_codes_to_headings_mapping or COMMIT_CODES_TO_HEADINGS_MAPPING
         )
+
+        # The deduplicated order regular sections should appear in, computed once instead of on every section build.
+        self._ordered_headings = [
+            heading
+            for heading in dict.fromkeys(
+                self.commit_codes_to_headings_mapping.values()
+            )
+            if heading not in (OTHER_SECTION_HEADING, UNCATEGORISED_SECTION_HEADING)
+        ]
+
         self.include_link_to_pull_request = include_link_to_pull_request
 
         logger.info(f"Using {self.stop_point!r} stop point.")
@@ -152,18 +233,18 @@ class PullRequestDescriptionGenerator:
         if not self.previous_notes:
             return autogenerated_release_notes
 
-        previous_notes_before_generated_section = self.previous_notes.split(
+        notes_before_generated_section, _, remainder = self.previous_notes.partition(
             AUTO_GENERATION_START_INDICATOR
         )
-        previous_notes_after_generated_section = "".join(
-            previous_notes_before_generated_section[1:]
-        ).split(AUTO_GENERATION_END_INDICATOR)
+        _, _, notes_after_generated_section = remainder.rpartition(
+            AUTO_GENERATION_END_INDICATOR
+        )
 
         return "\n".join(
             (
-                previous_notes_before_generated_section[0].strip("\n"),
+                notes_before_generated_section.strip("\n"),
                 autogenerated_release_notes,
-                previous_notes_after_generated_section[-1].strip("\n"),
+                notes_after_generated_section.strip("\n"),
             )
         ).strip('"\n')
 
@@ -179,13 +260,20 @@ class PullRequestDescriptionGenerator:
         else:
             headers = {"Authorization": f"token {api_token}"}
 
-        response = requests.get(pull_request_url, headers=headers)
+        response = _SESSION.get(pull_request_url, headers=headers)
 
         if response.status_code == 200:
             pull_request = response.json()
-            pull_request["commits"] = self._get_pull_request_commits(
-                pull_request, headers
-            )
+
+            # If autogeneration has been skipped, `generate` returns the previous notes untouched, so don't waste the
+            # network round trips of fetching the pull request's commits.
+            if pull_request["body"] and SKIP_INDICATOR in pull_request["body"]:
+                pull_request["commits"] = []
+            else:
+                pull_request["commits"] = self._get_pull_request_commits(
+                    pull_request, headers
+                )
+
             return pull_request
 
         logger.warning(
@@ -197,75 +285,204 @@ class PullRequestDescriptionGenerator:
         return None
 
     def _get_pull_request_commits(self, pull_request, headers):
-        """Get all the commits belonging to the pull request by requesting every page from the GitHub API.
+        """Get all the commits belonging to the pull request from the GitHub API. The GraphQL API resolves up to 100
+        commits per round trip regardless of repo history, so it's preferred when a token is available; it doesn't
+        accept unauthenticated requests, so fall back to REST pagination otherwise.
+
+        :param dict pull_request:
+        :param dict headers:
+        :return list:
+        """
+        if "Authorization" in headers:
+            return self._get_pull_request_commits_from_graphql(pull_request, headers)
+
+        return self._get_pull_request_commits_from_rest(pull_request, headers)
+
+    def _get_pull_request_commits_from_graphql(self, pull_request, headers):
+        """Get all the commits belonging to the pull request from the GitHub GraphQL API, 100 per round trip. The
+        commits are returned in the same shape as the REST API produces so the parsing downstream is unaffected.
 
         :param dict pull_request:
         :param dict headers:
         :return list:
         """
         commits = []
+        cursor = None
+
+        while True:
+            response = _SESSION.post(
+                GITHUB_GRAPHQL_URL,
+                json={
+                    "query": PULL_REQUEST_COMMITS_GRAPHQL_QUERY,
+                    "variables": {
+                        "owner": pull_request["base"]["repo"]["owner"]["login"],
+                        "name": pull_request["base"]["repo"]["name"],
+                        "number": pull_request["number"],
+                        "cursor": cursor,
+                    },
+                },
+                headers=headers,
+            )
+
+            commits_page = response.json()["data"]["repository"]["pullRequest"][
+                "commits"
+            ]
+
+            commits.extend(
+                {
+                    "sha": node["commit"]["oid"],
+                    "commit": {
+                        "message": node["commit"]["messageHeadline"]
+                        + "\n"
+                        + node["commit"]["messageBody"]
+                    },
+                }
+                for node in commits_page["nodes"]
+            )
+
+            if not commits_page["pageInfo"]["hasNextPage"]:
+                return commits
+
+            cursor = commits_page["pageInfo"]["endCursor"]
+
+    def _get_pull_request_commits_from_rest(self, pull_request, headers):
+        """Get all the commits belonging to the pull request from the GitHub REST API. The first page's "last" link
+        header reveals the total page count, so any remaining pages are fetched concurrently over a pooled session
+        instead of walking the "next" links one round trip at a time.
+
+        :param dict pull_request:
+        :param dict headers:
+        :return list:
+        """
+        first_page_url = pull_request["commits_url"] + "?per_page=100"
+
+        response = _SESSION.get(first_page_url, headers=headers)
+        commits = list(response.json())
 
-        response = requests.get(
-            pull_request["commits_url"] + "?per_page=100", headers=headers
+        if "last" not in response.links:
+            return commits
+
+        last_page = int(
+            parse_qs(urlparse(response.links["last"]["url"]).query)["page"][0]
         )
-        commits.extend(response.json())
 
-        while "next" in response.links:
-            response = requests.get(response.links["next"]["url"])
-            commits.extend(response.json())
+        remaining_page_urls = [
+            f"{first_page_url}&page={page}" for page in range(2, last_page + 1)
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            for page_response in executor.map(
+                lambda url: _SESSION.get(url, headers=headers), remaining_page_urls
+            ):
+                commits.extend(page_response.json())
 
         return commits
 
-    def _get_git_log(self):
-        """Get the one-line decorated git log formatted in the pattern of "hash|§header|§body|§decoration@@@".
+    def _get_stop_point_commit(self):
+        """Ask git for the commit the log should stop at - the last semantically-versioned release tag for the
+        "LAST_RELEASE" stop point or the merge base with the default branch for the "PULL_REQUEST_START" stop point.
+        Resolving this in git is much faster than regex-matching the decoration of every commit in Python.
+
+        :return str|None: the commit or tag to stop at, or `None` if git can't resolve one (e.g. no releases yet)
+        """
+        if self.stop_point == LAST_RELEASE:
+            command = [
+                "git",
+                "describe",
+                "--tags",
+                "--abbrev=0",
+                "--match",
+                "[0-9]*.[0-9]*.[0-9]*",
+            ]
+        else:
+            command = ["git", "merge-base", "origin/HEAD", "HEAD"]
+
+        result = subprocess.run(command, capture_output=True)
+
+        if result.returncode == 0:
+            return result.stdout.decode().strip() or None
+
+        return None
+
+    def _get_git_log(self, stop_point_commit=None):
+        """Stream the one-line decorated git log, with each entry formatted in the pattern of
+        "hash|§header|§body|§decoration".
 
         Explanation:
         * "|§" delimits the hash from the header, the header from the potentially multi-line body, and the body from the
           decoration
-        * "@@@" indicates the end of the git log line. "\n" cannot be used as commit bodies can contain newlines, so
-        they can't be used by themselves to delimit git log entries.
-        * The specific characters used for the delimiters have been chosen so that they are very uncommon to reduce
-          delimiting errors
+        * A null byte indicates the end of each git log entry. "\n" cannot be used as commit bodies can contain
+          newlines, so they can't be used by themselves to delimit git log entries.
+        * Entries are streamed from a `git log` subprocess rather than materialised all at once so that iteration can
+          stop early (e.g. at the last release tag) without git producing - and us decoding - the entire repo history
 
-        :return list(str):
+        :param str|None stop_point_commit: if given, only log commits after this commit or tag
+        :return iter(str): each git log entry as it's produced
         """
-        return (
-            subprocess.run(
-                ["git", "log", "--pretty=format:%h|§%s|§%b|§%d@@@"], capture_output=True
-            )
-            .stdout.strip()
-            .decode()
-        ).split("@@@")
+        command = ["git", "log", "--pretty=format:%h|§%s|§%b|§%d%x00"]
+
+        if stop_point_commit:
+            command.insert(2, f"{stop_point_commit}..HEAD")
+
+        process = subprocess.Popen(command, stdout=subprocess.PIPE)
+
+        try:
+            buffer = b""
+
+            for chunk in iter(lambda: process.stdout.read(8192), b""):
+                buffer += chunk
+                *entries, buffer = buffer.split(b"\x00")
+
+                for entry in entries:
+                    yield entry.decode()
+
+            if buffer.strip():
+                yield buffer.decode()
+
+        finally:
+            # Reached on early exit from the consuming loop as well as on exhaustion - stop git producing any further
+            # output.
+            process.stdout.close()
+            process.terminate()
+            process.wait()
 
     def _parse_commit_messages_from_git_log(self):
-        """Parse commit messages from the git log (formatted using `--pretty=format:%h|§%s|§%b|§%d@@@`) until the stop
-        point is reached. The parsed commit messages are returned separately to any that fail to parse.
+        """Parse commit messages from the streamed git log (formatted using `--pretty=format:%h|§%s|§%b|§%d%x00`) until
+        the stop point is reached. The parsed commit messages are returned separately to any that fail to parse.
 
         :return list(tuple), list(str):
         """
         parsed_commits = []
         unparsed_commits = []
 
-        for commit in self._get_git_log():
+        stop_point_commit = self._get_stop_point_commit()
+
+        for commit in self._get_git_log(stop_point_commit):
             hash, header, body, decoration = commit.split("|§")
 
-            if "tag" in decoration and bool(
-                SEMANTIC_VERSION_PATTERN.search(decoration)
+            # Only scan decorations for a release tag if git couldn't bound the log range itself.
+            if (
+                stop_point_commit is None
+                and "tag" in decoration
+                and bool(SEMANTIC_VERSION_PATTERN.search(decoration))
             ):
                 break
 
-            # Check if the commit message follows conventional commit format
-            match = CONVENTIONAL_COMMIT_PATTERN.match(header)
-            if not match:
-                if not COMMIT_REF_MERGE_PATTERN.search(header):
-                    unparsed_commits.append(header.strip())
+            # Check if the commit message follows conventional commit format or is a commit-ref merge
+            match = HEADER_PATTERN.match(header)
+
+            if match is None:
+                unparsed_commits.append(header.strip())
+                continue
+
+            if match["merge"]:
                 continue
 
             # Extract type and scope (if present)
             commit_type = match.group("type")
             scope = match.group("scope")
             # Get the rest of the message after the type(scope): prefix
-            message = header[header.find(":") + 1 :].strip()
+            message = header[match.end() :].strip()
 
             parsed_commits.append(
                 (commit_type.strip(), scope, message.strip(), body.strip())
@@ -286,18 +503,21 @@ class PullRequestDescriptionGenerator:
             header, *body = commit["commit"]["message"].split("\n")
             body = "\n".join(body)
 
-            # Check if the commit message follows conventional commit format
-            match = CONVENTIONAL_COMMIT_PATTERN.match(header)
-            if not match:
-                if not COMMIT_REF_MERGE_PATTERN.search(header):
-                    unparsed_commits.append(header.strip())
+            # Check if the commit message follows conventional commit format or is a commit-ref merge
+            match = HEADER_PATTERN.match(header)
+
+            if match is None:
+                unparsed_commits.append(header.strip())
+                continue
+
+            if match["merge"]:
                 continue
 
             # Extract type and scope (if present)
             commit_type = match.group("type")
             scope = match.group("scope")
             # Get the rest of the message after the type(scope): prefix
-            message = header[header.find(":") + 1 :].strip()
+            message = header[match.end() :].strip()
 
             parsed_commits.append(
                 (commit_type.strip(), scope, message.strip(), body.strip())
@@ -312,46 +532,64 @@ class PullRequestDescriptionGenerator:
 
         :param iter(tuple) parsed_commits:
         :param iter(str) unparsed_commits:
-        :return (dict, list): a mapping of section headers to a dict of scopes and their commits, and a list of breaking change commits
+        :return (dict, list): a mapping of section headers to a dict of scopes and their deduplicated commits (keyed by lowercase commit note), and a list of breaking change commits
         """
-        # Initialize with an empty dict for each heading instead of a list
+        # Map each heading to a dict of scopes, and each scope to an insertion-ordered dict of lowercase commit notes
+        # to original commit notes. The lowercase keys give case-insensitive duplicate detection without maintaining a
+        # parallel tracker structure (and its second hash operation per commit).
         categorised_commits = {
             heading: {} for heading in self.commit_codes_to_headings_mapping.values()
         }
+        categorised_commits[OTHER_SECTION_HEADING] = {"Miscellaneous": {}}
+        categorised_commits[UNCATEGORISED_SECTION_HEADING] = {"Miscellaneous": {}}
         categorised_commits[BREAKING_CHANGE_COUNT_KEY] = 0
 
-        # Track lowercase versions of commit messages for case-insensitive duplicate detection
-        commit_message_tracker = {
-            heading: {} for heading in self.commit_codes_to_headings_mapping.values()
-        }
-        commit_message_tracker[OTHER_SECTION_HEADING] = {"Miscellaneous": set()}
-        commit_message_tracker[UNCATEGORISED_SECTION_HEADING] = {"Miscellaneous": set()}
-
         breaking_change_upgrade_instructions = []
 
+        # Bind the hottest lookups to locals so the per-commit loop does LOAD_FAST instead of attribute and global
+        # lookups on every iteration.
+        lookup_heading = self.commit_codes_to_headings_mapping.get
+        breaking_change_indicators = CONVENTIONAL_COMMIT_BREAKING_CHANGE_INDICATORS
+        find_tickets = TICKET_PATTERN.findall
+
         for code, scope, header, body in parsed_commits:
-            try:
+            # Get the appropriate heading for this commit type with a single lookup - much cheaper than a membership
+            # test followed by a subscript, or raising and catching a KeyError for every unknown code.
+            heading = lookup_heading(code)
+
+            # For commits with unknown types, add them to the OTHER section
+            if heading is None:
+                self._tickets.extend(find_tickets(header))
+
+                # Case-insensitive duplicate check
+                other_notes = categorised_commits[OTHER_SECTION_HEADING][
+                    "Miscellaneous"
+                ]
+                lowercase_header = header.lower()
+
+                if lowercase_header not in other_notes:
+                    other_notes[lowercase_header] = header
+            else:
                 # Use "Miscellaneous" if no scope is provided
                 effective_scope = scope if scope else "Miscellaneous"
 
-                # Get the appropriate heading for this commit type
-                heading = self.commit_codes_to_headings_mapping[code]
-
-                # Initialize the scope dict if it doesn't exist
-                if effective_scope not in categorised_commits[heading]:
-                    categorised_commits[heading][effective_scope] = []
-                    commit_message_tracker[heading][effective_scope] = set()
+                # Get the scope's notes, initializing the scope dict if it doesn't exist - a single setdefault rather
+                # than a membership test, an insertion and another lookup
+                scope_notes = categorised_commits[heading].setdefault(
+                    effective_scope, {}
+                )
 
-                if any(
-                    indicator in body
-                    for indicator in CONVENTIONAL_COMMIT_BREAKING_CHANGE_INDICATORS
+                # Both indicators contain "BREAKING", so one scan for it rules most commit bodies out before the
+                # per-indicator scans run.
+                if "BREAKING" in body and any(
+                    indicator in body for indicator in breaking_change_indicators
                 ):
                     commit_note = BREAKING_CHANGE_INDICATOR + header
                     categorised_commits[BREAKING_CHANGE_COUNT_KEY] += 1
 
                     # Remove the breaking change indicator from the body and put the body in a collapsible section
                     # under the commit header.
-                    upgrade_instruction = ":".join(body.split(":")[1:]).strip()
+                    upgrade_instruction = body.partition(":")[2].strip()
 
                     breaking_change_upgrade_instructions.append(
                         "<details>\n"
@@ -362,67 +600,26 @@ class PullRequestDescriptionGenerator:
                 else:
                     commit_note = header
 
+                # Collect ticket IDs as notes are added so the tree doesn't need a second full scan later.
+                self._tickets.extend(find_tickets(commit_note))
+
                 # Case-insensitive duplicate check
                 lowercase_note = commit_note.lower()
-                if (
-                    lowercase_note
-                    not in commit_message_tracker[heading][effective_scope]
-                ):
-                    categorised_commits[heading][effective_scope].append(commit_note)
-                    commit_message_tracker[heading][effective_scope].add(lowercase_note)
-
-            except KeyError:
-                # For commits with unknown types, add them to the OTHER section
-                if "Miscellaneous" not in categorised_commits[OTHER_SECTION_HEADING]:
-                    categorised_commits[OTHER_SECTION_HEADING]["Miscellaneous"] = []
-                    commit_message_tracker[OTHER_SECTION_HEADING]["Miscellaneous"] = (
-                        set()
-                    )
 
-                # Case-insensitive duplicate check
-                lowercase_header = header.lower()
-                if (
-                    lowercase_header
-                    not in commit_message_tracker[OTHER_SECTION_HEADING][
-                        "Miscellaneous"
-                    ]
-                ):
-                    categorised_commits[OTHER_SECTION_HEADING]["Miscellaneous"].append(
-                        header
-                    )
-                    commit_message_tracker[OTHER_SECTION_HEADING]["Miscellaneous"].add(
-                        lowercase_header
-                    )
+                if lowercase_note not in scope_notes:
+                    scope_notes[lowercase_note] = commit_note
 
-        try:
-            # Handle uncategorized commits (with case-insensitive duplicate removal)
-            if (
-                "Miscellaneous"
-                not in categorised_commits[UNCATEGORISED_SECTION_HEADING]
-            ):
-                categorised_commits[UNCATEGORISED_SECTION_HEADING]["Miscellaneous"] = []
-                commit_message_tracker[UNCATEGORISED_SECTION_HEADING][
-                    "Miscellaneous"
-                ] = set()
-
-            for commit in unparsed_commits:
-                lowercase_commit = commit.lower()
-                if (
-                    lowercase_commit
-                    not in commit_message_tracker[UNCATEGORISED_SECTION_HEADING][
-                        "Miscellaneous"
-                    ]
-                ):
-                    categorised_commits[UNCATEGORISED_SECTION_HEADING][
-                        "Miscellaneous"
-                    ].append(commit)
-                    commit_message_tracker[UNCATEGORISED_SECTION_HEADING][
-                        "Miscellaneous"
-                    ].add(lowercase_commit)
-        except KeyError:
-            logger.warning(
-                "Uncategorised commits could not be added to the release notes."
-            )
+        # Handle uncategorized commits (with case-insensitive duplicate removal)
+        uncategorised_notes = categorised_commits[UNCATEGORISED_SECTION_HEADING][
+            "Miscellaneous"
+        ]
+
+        for commit in unparsed_commits:
+            self._tickets.extend(TICKET_PATTERN.findall(commit))
+            lowercase_commit = commit.lower()
+
+            if lowercase_commit not in uncategorised_notes:
+                uncategorised_notes[lowercase_commit] = commit
 
         return categorised_commits, breaking_change_upgrade_instructions
 
@@ -468,31 +665,31 @@ class PullRequestDescriptionGenerator:
         Returns:
             List[str]: List of unique ticket IDs
         """
-        ticket_re = re.compile(r"[a-zA-Z]{2,6}-\d+")
         tickets = set()
         formatted_categorised_messages = {}
 
         # Extract ticket IDs from the branch name and PR title
-        matches = ticket_re.findall(self.current_pull_request['head']["ref"])
+        matches = TICKET_PATTERN.findall(self.current_pull_request['head']["ref"])
         for match in matches:
             tickets.add(f"[{match}]({JIRA_URL_PREFIX + match})")
-        
-        matches = ticket_re.findall(self.current_pull_request['title'])
+
+        matches = TICKET_PATTERN.findall(self.current_pull_request['title'])
         for match in matches:
             tickets.add(f"[{match}]({JIRA_URL_PREFIX + match})")
 
+        # Ticket IDs from the commit notes were already collected during categorisation.
+        for match in dict.fromkeys(self._tickets):
+            tickets.add(f"[{match}]({JIRA_URL_PREFIX + match})")
+
         for heading, scoped_notes in categorised_commit_messages.items():
+            # Sort the scope keys alone (cheaper than sorting (scope, notes) pairs) and insert in that order, so
+            # downstream consumers can just iterate the formatted mapping.
             formatted_scoped_notes = {}
-            for scope, notes in sorted(scoped_notes.items()):
+            for scope in sorted(scoped_notes):
                 formatted_notes = []
-                for note in notes:
-                    # Find and extract ticket IDs
-                    matches = ticket_re.findall(note)
-                    for match in matches:
-                        tickets.add(f"[{match}]({JIRA_URL_PREFIX + match})")
-
+                for note in scoped_notes[scope].values():
                     # Replace ticket IDs with parenthesized version
-                    formatted_note = ticket_re.sub(lambda m: f"[ [{m.group(0)}]({JIRA_URL_PREFIX + m.group(0)}) ]", note)
+                    formatted_note = TICKET_PATTERN.sub(lambda m: f"[ [{m.group(0)}]({JIRA_URL_PREFIX + m.group(0)}) ]", note)
                     formatted_notes.append(formatted_note)
 
                 formatted_scoped_notes[scope] = formatted_notes
@@ -522,45 +719,36 @@ class PullRequestDescriptionGenerator:
         # else:
         #     link_to_pull_request = ""
 
-        contents_section = ""
+        contents_parts = []
 
         tickets, formatted_messages = self._extract_and_format_tickets(
             categorised_commit_messages
         )
 
-        # contents_section += f"{self.header}\n\n"
-
         if tickets:
-            contents_section += "## 🎫 Tickets\n\n"
+            contents_parts.append("## 🎫 Tickets\n\n")
             # Dedup keys maintaining insertion order using dict.fromkeys(tickets).keys() instead of set(tickets)
-            contents_section += "\n".join(
-                " - " + note for note in dict.fromkeys(tickets).keys()
+            contents_parts.append(
+                "\n".join(" - " + note for note in dict.fromkeys(tickets).keys())
             )
-
-            contents_section += "\n\n"
+            contents_parts.append("\n\n")
 
         if breaking_change_count:
-            contents_section += self._create_breaking_change_warning(
-                breaking_change_count
+            contents_parts.append(
+                self._create_breaking_change_warning(breaking_change_count)
             )
 
-        # Process regular sections first (excluding OTHER and UNCATEGORISED)
-        for heading, scoped_notes in formatted_messages.items():
-            # Skip special sections and empty sections
-            if (
-                heading
-                in {
-                    OTHER_SECTION_HEADING,
-                    UNCATEGORISED_SECTION_HEADING,
-                    BREAKING_CHANGE_COUNT_KEY,
-                }
-                or not scoped_notes
-                or not any(notes for scope, notes in scoped_notes.items())
-            ):
+        # Process regular sections first (excluding OTHER and UNCATEGORISED), skipping empty ones
+        for heading in self._ordered_headings:
+            scoped_notes = formatted_messages.get(heading)
+
+            if not scoped_notes or not any(scoped_notes.values()):
                 continue
 
-            contents_section += self._create_contents_subsection(
-                heading=heading, scoped_notes=scoped_notes
+            contents_parts.append(
+                self._create_contents_subsection(
+                    heading=heading, scoped_notes=scoped_notes
+                )
             )
 
         # Process OTHER and UNCATEGORISED sections last, but only if they have content
@@ -568,12 +756,14 @@ class PullRequestDescriptionGenerator:
             scoped_notes = formatted_messages.get(heading, {})
 
             # Check if there are any actual notes in any of the scopes
-            if scoped_notes and any(notes for scope, notes in scoped_notes.items()):
-                contents_section += self._create_contents_subsection(
-                    heading=heading, scoped_notes=scoped_notes
+            if scoped_notes and any(scoped_notes.values()):
+                contents_parts.append(
+                    self._create_contents_subsection(
+                        heading=heading, scoped_notes=scoped_notes
+                    )
                 )
 
-        return contents_section
+        return "".join(contents_parts)
 
     def _create_breaking_change_warning(self, breaking_change_count):
         """Create a breaking change warning string.
@@ -593,26 +783,26 @@ class PullRequestDescriptionGenerator:
         containing the notes formatted into bulleted lists.
 
         :param str heading:
-        :param dict scoped_notes: A dictionary mapping scopes to lists of notes
+        :param dict scoped_notes: A dictionary mapping scopes to lists of notes, in the order they should appear
         :return str:
         """
-        subsection = f"{heading}\n"
+        subsection_parts = [f"{heading}\n"]
 
-        for scope, notes in sorted(scoped_notes.items()):
+        # The scopes were already inserted in sorted order by `_extract_and_format_tickets`.
+        for scope, notes in scoped_notes.items():
             if not notes:
                 continue
 
             # Add a subheading for the scope
-            formatted_scope = re.sub(r"[-_]+", " ", scope).title()
-            subsection += f"### {formatted_scope}\n"
+            subsection_parts.append(f"### {_format_scope(scope)}\n")
 
             # Add the bulleted list of notes under this scope
             note_lines = "\n".join(
-                " - " + (note[:1].upper() + note[1:]) for note in notes
+                " - " + _capitalise_first_letter(note) for note in notes
             )
-            subsection += f"{note_lines}\n\n"
+            subsection_parts.append(f"{note_lines}\n\n")
 
-        return subsection
+        return "".join(subsection_parts)
 
     def _create_breaking_change_upgrade_section(self, upgrade_instructions):
         """Create an upgrade section explaining how to update to deal with breaking changes.